@@ -6,23 +6,224 @@ exposes every method as a LlamaIndex ``FunctionTool``.
 
 from __future__ import annotations
 
-from typing import List, Optional
+import asyncio
+import io
+import itertools
+import operator
+import random
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import nativ as _nativ_sdk
-from llama_index.core.tools.tool_spec.base import BaseToolSpec
+from llama_index.core.tools import FunctionTool, ToolMetadata
+from llama_index.core.tools.tool_spec.base import SPEC_FUNCTION_TYPE, BaseToolSpec
+
+# Upper bound on cached read-tool results per spec; TM searches are keyed by
+# their arguments, so the cache would otherwise grow with every new query.
+# The least recently used result is evicted first.
+_CACHE_MAXSIZE = 256
+
+# Length-adaptive default for the TM search ``min_score``.  Short queries
+# match a huge number of trigram candidates server-side, so they get a
+# strict threshold that relaxes linearly to the floor at ~300 characters.
+_MIN_SCORE_SHORT = 95.0
+_MIN_SCORE_LONG = 50.0
+_MIN_SCORE_SPAN = 300
+
+# Recently added TM entries kept per spec (for ``cache_ttl`` seconds) so
+# exact-match searches for them can be answered without a round trip.
+_RECENT_TM_MAXSIZE = 1024
+
+# Transient errors worth retrying locally rather than surfacing to the agent,
+# which would otherwise spend a whole LLM turn re-issuing the tool call.
+# Writes only retry on 429: a 5xx may come after the entry was stored.
+_RETRYABLE_ERRORS = (_nativ_sdk.RateLimitError, _nativ_sdk.ServerError)
+_RETRYABLE_WRITE_ERRORS = (_nativ_sdk.RateLimitError,)
+_RETRY_MAX_DELAY = 30.0
+
+# Options ``nativ._client.Nativ.translate_batch`` passes to each per-text
+# ``translate`` call, mirrored as of nativ 0.3.1 (the lower bound pinned in
+# pyproject.toml).  translate_batch here calls ``translate`` directly, so
+# re-check these when raising that bound or if the SDK gains a real batch
+# endpoint.
+_BATCH_TRANSLATE_OPTIONS = MappingProxyType(
+    {"include_tm_info": True, "backtranslate": False, "include_rationale": False}
+)
+
+_T = TypeVar("_T")
+
+# Worker threads for background batch jobs.  Each job still fans its texts
+# out over its own pool, so a couple of workers is enough.
+_JOB_WORKERS = 2
+
+# Finished batch jobs kept for fetching; beyond this the oldest finished jobs
+# that were never fetched are dropped.
+_MAX_JOBS = 256
+
+# Set once the interpreter starts shutting down.  concurrent.futures joins its
+# worker threads at exit and runs every queued item first, so a script that
+# submits a large batch job and returns would otherwise stay alive until the
+# whole catalog is translated.  Batch work checks this flag before each text
+# instead.  Plain atexit handlers run only after those threads are joined, so
+# the flag is set from the threading exit hook; being registered after
+# concurrent.futures' own hook, it runs first.
+_shutting_down = threading.Event()
+threading._register_atexit(_shutting_down.set)
+
+
+def _default_min_score(query: str) -> float:
+    slope = (_MIN_SCORE_SHORT - _MIN_SCORE_LONG) / _MIN_SCORE_SPAN
+    return max(_MIN_SCORE_LONG, _MIN_SCORE_SHORT - len(query) * slope)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter: ~1s, ~2s, ~4s, ... capped at 30s."""
+    return min(_RETRY_MAX_DELAY, 2**attempt + random.random())
+
+
+def _dedupe(texts: List[str]) -> Tuple[List[str], Optional[List[int]]]:
+    """Split *texts* into unique strings (first-seen order) and positions.
+
+    The second item maps each original position to its index in the unique
+    list, or is ``None`` when *texts* has no repeats.
+    """
+    index: Dict[str, int] = {}
+    inverse = [index.setdefault(t, len(index)) for t in texts]
+    if len(index) == len(texts):
+        return texts, None
+    return list(index), inverse
+
+
+def _merge_recent_match(
+    recent: _nativ_sdk.TMSearchMatch,
+    matches: List[_nativ_sdk.TMSearchMatch],
+    limit: int,
+) -> List[_nativ_sdk.TMSearchMatch]:
+    """Put a locally known exact match first, ahead of the server results.
+
+    The server may not have indexed a just-added entry yet, or may return it
+    alongside the local copy; duplicates of *recent* are dropped.
+    """
+    rest = [
+        m
+        for m in matches
+        if m.tm_id != recent.tm_id
+        and (m.source_text, m.target_text) != (recent.source_text, recent.target_text)
+    ]
+    return [recent, *rest][:limit]
+
+
+# C-level field accessors for the list formatters; each yields the fields in
+# the order the matching template below consumes them.
+_get_translated_text = operator.attrgetter("translated_text")
+_get_match_fields = operator.attrgetter(
+    "score", "match_type", "source_text", "target_text"
+)
+_get_language_fields = operator.attrgetter("language", "language_code", "formality")
+
+# Per-row templates for the list formatters.
+_MATCH_TMPL = '\n- [{0:.0f}% {1}] "{2}" -> "{3}"'
+_LANGUAGE_TMPL = "\n- {0} ({1})"
+_FORMALITY_TMPL = " -- formality: {0}"
+_BATCH_LINE_TMPL = "{0}. {1}"
+_STYLE_GUIDE_TMPL = "\n\n## {title} [{status}]\n{content}"
 
 
 def _fmt_translation(t: _nativ_sdk.Translation) -> str:
-    parts = [t.translated_text]
-    if t.rationale:
-        parts.append(f"Rationale: {t.rationale}")
-    if t.backtranslation:
-        parts.append(f"Back-translation: {t.backtranslation}")
-    if t.tm_match and t.tm_match.score > 0:
-        parts.append(
-            f"TM match: {t.tm_match.score:.0f}% ({t.tm_match.match_type})"
+    rationale = t.rationale
+    bt = t.backtranslation
+    tm = t.tm_match
+    extras = (
+        rationale and f"Rationale: {rationale}",
+        bt and f"Back-translation: {bt}",
+        tm is not None
+        and tm.score > 0.0
+        and f"TM match: {tm.score:.0f}% ({tm.match_type})",
+    )
+    return "\n".join((t.translated_text, *filter(None, extras)))
+
+
+def _fmt_batch(results: List[_nativ_sdk.Translation]) -> str:
+    # Pull the text column out first, then number it with C-level iterators.
+    texts = list(map(_get_translated_text, results))
+    return "\n".join(map(_BATCH_LINE_TMPL.format, range(1, len(texts) + 1), texts))
+
+
+def _fmt_tm_matches(matches: List[_nativ_sdk.TMSearchMatch]) -> str:
+    if not matches:
+        return "No matches found in translation memory."
+    buf = io.StringIO()
+    buf.write(f"Found {len(matches)} match(es):")
+    for score, match_type, source_text, target_text in map(_get_match_fields, matches):
+        buf.write(_MATCH_TMPL.format(score, match_type, source_text, target_text))
+    return buf.getvalue()
+
+
+def _fmt_tm_entry(entry: _nativ_sdk.TMEntry) -> str:
+    return (
+        f"Added TM entry {entry.id}: "
+        f'"{entry.source_text}" ({entry.source_language_code}) -> '
+        f'"{entry.target_text}" ({entry.target_language_code})'
+    )
+
+
+def _fmt_languages(langs: List[_nativ_sdk.Language]) -> str:
+    if not langs:
+        return "No languages configured."
+    # Each row template starts with its own newline, so rows join on "".
+    return "Configured languages:" + "".join(
+        _LANGUAGE_TMPL.format(language, code)
+        + (_FORMALITY_TMPL.format(formality) if formality else "")
+        for language, code, formality in map(_get_language_fields, langs)
+    )
+
+
+def _fmt_style_guides(guides: List[_nativ_sdk.StyleGuide]) -> str:
+    if not guides:
+        return "No style guides configured."
+    return f"Style guides ({len(guides)}):" + "".join(
+        _STYLE_GUIDE_TMPL.format(
+            title=g.title,
+            status="enabled" if g.is_enabled else "disabled",
+            content=g.content,
         )
-    return "\n".join(parts)
+        for g in guides
+    )
+
+
+def _fmt_brand_voice(bv: _nativ_sdk.BrandVoice) -> str:
+    if not bv.exists or not bv.prompt:
+        return "No brand voice configured."
+    return f"Brand voice:\n{bv.prompt}"
+
+
+def _fmt_tm_stats(stats: _nativ_sdk.TMStats) -> str:
+    buf = io.StringIO()
+    buf.write(
+        f"Translation memory: {stats.total} total entries\n"
+        f"  Enabled: {stats.enabled}\n"
+        f"  Disabled: {stats.disabled}"
+    )
+    if stats.by_source:
+        buf.write("\n  By source:")
+        for source, counts in stats.by_source.items():
+            buf.write(f"\n    {source}: {counts}")
+    return buf.getvalue()
 
 
 class NativToolSpec(BaseToolSpec):
@@ -34,31 +235,384 @@ class NativToolSpec(BaseToolSpec):
 
         tools = NativToolSpec().to_tool_list()       # reads NATIV_API_KEY from env
         tools = NativToolSpec(api_key="nativ_...").to_tool_list()
+
+    Results of the read-only tools (languages, style guides, brand voice,
+    TM stats and TM searches) are cached for ``cache_ttl`` seconds; pass
+    ``cache_ttl=0`` to disable caching or call ``invalidate_cache()`` to
+    drop stale entries.  Single-result exact-match searches
+    (``min_score=100, limit=1``) for entries added through the spec within
+    ``cache_ttl`` are answered without an API call.
+
+    Rate-limit (429) and server (5xx) errors are retried up to
+    ``max_retries`` times with exponential backoff before being raised.
+
+    ``translate_batch`` translates each text in its own request, with up to
+    ``batch_max_concurrency`` requests in flight at a time.  For
+    very large catalogs, ``submit_translate_batch`` runs the same batch in
+    the background and ``fetch_translate_batch_result`` collects it, so an
+    agent can keep working in between.
     """
 
-    spec_functions = [
-        "translate",
-        "translate_batch",
-        "search_translation_memory",
-        "add_translation_memory_entry",
-        "get_languages",
-        "get_style_guides",
-        "get_brand_voice",
-        "get_translation_memory_stats",
-    ]
+    # (sync, async) pairs: each becomes one FunctionTool with both ``fn``
+    # and ``async_fn`` set, named and described after the sync method.
+    spec_functions = (
+        ("translate", "atranslate"),
+        ("translate_batch", "atranslate_batch"),
+        ("search_translation_memory", "asearch_translation_memory"),
+        ("add_translation_memory_entry", "aadd_translation_memory_entry"),
+        ("get_languages", "aget_languages"),
+        ("get_style_guides", "aget_style_guides"),
+        ("get_brand_voice", "aget_brand_voice"),
+        ("get_translation_memory_stats", "aget_translation_memory_stats"),
+        ("prefetch_workspace_metadata", "aprefetch_workspace_metadata"),
+        "submit_translate_batch",
+        "fetch_translate_batch_result",
+    )
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         *,
         base_url: Optional[str] = None,
+        cache_ttl: float = 60.0,
+        batch_max_concurrency: int = 4,
+        max_retries: int = 3,
     ) -> None:
         super().__init__()
         self._api_key = api_key
         self._base_url = base_url
+        self._cache_ttl = cache_ttl
+        self._batch_max_concurrency = max(1, batch_max_concurrency)
+        self._max_retries = max(0, max_retries)
+        self._cache: OrderedDict[Tuple[Any, ...], Tuple[float, str]] = OrderedDict()
+        self._recent_tm_entries: OrderedDict[
+            Tuple[str, str, str], Tuple[float, _nativ_sdk.TMEntry]
+        ] = OrderedDict()
+        self._sync_client: Optional[_nativ_sdk.Nativ] = None
+        self._sync_finalizer: Optional[weakref.finalize] = None
+        self._sync_lock = threading.Lock()
+        self._async_client: Optional[_nativ_sdk.AsyncNativ] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tool_list_cache: Optional[List[FunctionTool]] = None
+        self._jobs: Dict[str, Future[str]] = {}
+        self._jobs_lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+        self._job_executor: Optional[ThreadPoolExecutor] = None
+
+    def to_tool_list(
+        self,
+        spec_functions: Optional[List[SPEC_FUNCTION_TYPE]] = None,
+        func_to_metadata_mapping: Optional[Dict[str, ToolMetadata]] = None,
+    ) -> List[FunctionTool]:
+        """Convert the spec to tools, building the default list only once.
+
+        Building a ``FunctionTool`` introspects the method signature and
+        generates a Pydantic schema.  Those schemas are shared by every spec
+        of the class, while each spec gets its own ``ToolMetadata`` copies
+        so editing one tool's description never leaks into another spec.
+        The default list is additionally memoized per spec.  Custom
+        ``spec_functions`` or metadata bypass both caches.
+        """
+        if spec_functions is not None or func_to_metadata_mapping is not None:
+            return super().to_tool_list(spec_functions, func_to_metadata_mapping)
+        if self._tool_list_cache is None:
+            metadata = {
+                name: ToolMetadata(
+                    name=name, description=description, fn_schema=fn_schema
+                )
+                for name, (description, fn_schema) in self._tool_metadata().items()
+            }
+            self._tool_list_cache = super().to_tool_list(
+                func_to_metadata_mapping=metadata
+            )
+        return list(self._tool_list_cache)
+
+    @classmethod
+    def _tool_metadata(cls) -> Mapping[str, Tuple[str, Any]]:
+        # Tool names, descriptions and schemas depend only on the method
+        # signatures and docstrings, never on api_key/base_url, so they are
+        # derived once per class from the plain functions.  Only immutable
+        # (description, fn_schema) pairs are cached, in a read-only mapping;
+        # to_tool_list builds fresh ToolMetadata from them for every spec.
+        mapping = cls.__dict__.get("_tool_metadata_cache")
+        if mapping is None:
+            built = {}
+            for func_spec in cls.spec_functions:
+                name = func_spec if isinstance(func_spec, str) else func_spec[0]
+                meta = FunctionTool.from_defaults(fn=getattr(cls, name)).metadata
+                built[name] = (meta.description, meta.fn_schema)
+            mapping = MappingProxyType(built)
+            cls._tool_metadata_cache = mapping
+        return mapping
 
     def _client(self) -> _nativ_sdk.Nativ:
-        return _nativ_sdk.Nativ(api_key=self._api_key, base_url=self._base_url)
+        # One SDK client per spec so every tool call reuses the same
+        # keep-alive connection pool instead of paying a fresh TCP/TLS
+        # handshake.  The finalizer closes the pool when the spec is
+        # garbage-collected or at interpreter exit, whichever comes first.
+        client = self._sync_client
+        if client is not None:
+            return client
+        # Tools may run on worker threads (batch texts, agent tool
+        # dispatch); the lock makes sure only one client is ever built.
+        with self._sync_lock:
+            if self._sync_client is None:
+                client = _nativ_sdk.Nativ(
+                    api_key=self._api_key, base_url=self._base_url
+                )
+                self._sync_finalizer = weakref.finalize(self, client.close)
+                self._sync_client = client
+            return self._sync_client
+
+    def _aclient(self) -> _nativ_sdk.AsyncNativ:
+        # Async counterpart of ``_client``.  An ``httpx.AsyncClient`` cannot
+        # be closed without an event loop, so there is no finalizer here;
+        # use ``aclose()`` or ``async with`` to release it.  Its connections
+        # are bound to the event loop that opened them, so a call from a new
+        # loop (e.g. a second ``asyncio.run``) gets a fresh client; the old
+        # loop is gone by then and its pool cannot be closed any more.
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = _nativ_sdk.AsyncNativ(
+                api_key=self._api_key, base_url=self._base_url
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    def _job_pool(self) -> ThreadPoolExecutor:
+        with self._sync_lock:
+            if self._job_executor is None:
+                self._job_executor = ThreadPoolExecutor(
+                    max_workers=_JOB_WORKERS, thread_name_prefix="nativ-batch"
+                )
+            return self._job_executor
+
+    def close(self) -> None:
+        """Release the underlying HTTP connection pool.
+
+        Waits for running background batch jobs and cancels queued ones.
+        The spec stays usable; the next tool call opens a new pool.  At
+        interpreter exit, unfinished jobs stop after their in-flight texts
+        without needing ``close()``.
+        """
+        with self._sync_lock:
+            executor, self._job_executor = self._job_executor, None
+        # Shut down outside the lock: running jobs need it to reach the client.
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        with self._sync_lock:
+            if self._sync_finalizer is not None:
+                self._sync_finalizer()
+            self._sync_client = None
+            self._sync_finalizer = None
+
+    def __enter__(self) -> "NativToolSpec":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Release the sync and async HTTP connection pools.
+
+        Waiting for running background batch jobs happens on a worker
+        thread, so the event loop keeps running in the meantime.
+        """
+        await asyncio.to_thread(self.close)
+        client, self._async_client = self._async_client, None
+        loop, self._async_loop = self._async_loop, None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.close()
+
+    async def __aenter__(self) -> "NativToolSpec":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    def _call_with_retry(
+        self,
+        fn: Callable[..., _T],
+        *args: Any,
+        retry_on: Tuple[type, ...] = _RETRYABLE_ERRORS,
+        **kwargs: Any,
+    ) -> _T:
+        for attempt in range(self._max_retries):
+            try:
+                return fn(*args, **kwargs)
+            except retry_on:
+                time.sleep(_retry_delay(attempt))
+        return fn(*args, **kwargs)
+
+    async def _acall_with_retry(
+        self,
+        fn: Callable[..., Awaitable[_T]],
+        *args: Any,
+        retry_on: Tuple[type, ...] = _RETRYABLE_ERRORS,
+        **kwargs: Any,
+    ) -> _T:
+        for attempt in range(self._max_retries):
+            try:
+                return await fn(*args, **kwargs)
+            except retry_on:
+                await asyncio.sleep(_retry_delay(attempt))
+        return await fn(*args, **kwargs)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached read-tool results and remembered TM entries."""
+        self._cache.clear()
+        self._recent_tm_entries.clear()
+
+    def _remember_tm_entry(self, entry: _nativ_sdk.TMEntry) -> None:
+        if not entry.enabled or self._cache_ttl <= 0:
+            return
+        key = (
+            entry.source_language_code, entry.target_language_code,
+            entry.source_text,
+        )
+        self._recent_tm_entries[key] = (time.monotonic() + self._cache_ttl, entry)
+        self._recent_tm_entries.move_to_end(key)
+        if len(self._recent_tm_entries) > _RECENT_TM_MAXSIZE:
+            self._recent_tm_entries.popitem(last=False)
+
+    def _recent_tm_match(
+        self,
+        query: str,
+        source_language_code: str,
+        target_language_code: Optional[str],
+        min_score: float,
+    ) -> Optional[_nativ_sdk.TMSearchMatch]:
+        # Only an exact-match search (min_score >= 100) for one language pair
+        # can be matched against an entry we just stored ourselves.
+        if min_score < 100 or target_language_code is None:
+            return None
+        key = (source_language_code, target_language_code, query)
+        hit = self._recent_tm_entries.get(key)
+        if hit is None:
+            return None
+        expires_at, entry = hit
+        if time.monotonic() >= expires_at:
+            self._recent_tm_entries.pop(key, None)
+            return None
+        return _nativ_sdk.TMSearchMatch(
+            tm_id=entry.id,
+            score=100.0,
+            match_type="exact",
+            source_text=entry.source_text,
+            target_text=entry.target_text,
+            information_source=entry.information_source,
+        )
+
+    def _search_prelude(
+        self,
+        query: str,
+        source_language_code: str,
+        target_language_code: Optional[str],
+        min_score: Optional[float],
+        limit: int,
+    ) -> Tuple[Optional[str], Dict[str, Any], Optional[_nativ_sdk.TMSearchMatch]]:
+        # Everything the sync and async TM searches do before calling the
+        # API.  Returns (answer, search_tm options, recent match); answer is
+        # set when the search is served locally, from a recent entry or the
+        # cache.
+        if min_score is None:
+            min_score = _default_min_score(query)
+        recent = self._recent_tm_match(
+            query, source_language_code, target_language_code, min_score
+        )
+        if recent is not None and limit == 1:
+            return _fmt_tm_matches([recent]), {}, recent
+        options = {
+            "source_language_code": source_language_code,
+            "target_language_code": target_language_code,
+            "min_score": min_score,
+            "limit": limit,
+        }
+        return self._cache_get(("search_tm", query, *options.values())), options, recent
+
+    def _search_result(
+        self,
+        query: str,
+        options: Dict[str, Any],
+        recent: Optional[_nativ_sdk.TMSearchMatch],
+        matches: List[_nativ_sdk.TMSearchMatch],
+    ) -> str:
+        if recent is not None:
+            matches = _merge_recent_match(recent, matches, options["limit"])
+        key = ("search_tm", query, *options.values())
+        return self._cache_put(key, _fmt_tm_matches(matches))
+
+    def _cache_get(self, key: Tuple[Any, ...]) -> Optional[str]:
+        hit = self._cache.get(key)
+        if hit is None:
+            return None
+        expires_at, value = hit
+        if time.monotonic() >= expires_at:
+            self._cache.pop(key, None)
+            return None
+        self._cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, key: Tuple[Any, ...], value: str) -> str:
+        if self._cache_ttl > 0:
+            self._cache[key] = (time.monotonic() + self._cache_ttl, value)
+            if len(self._cache) > _CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+        return value
+
+    def _cached_read(self, method: str, fmt: Callable[[Any], str]) -> str:
+        # Argument-less reads are cached under the SDK method's name.
+        key = (method,)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        result = self._call_with_retry(getattr(self._client(), method))
+        return self._cache_put(key, fmt(result))
+
+    async def _acached_read(self, method: str, fmt: Callable[[Any], str]) -> str:
+        key = (method,)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        result = await self._acall_with_retry(getattr(self._aclient(), method))
+        return self._cache_put(key, fmt(result))
+
+    def _translate_texts(
+        self, texts: List[str], target_language: str, **kwargs: Any
+    ) -> List[_nativ_sdk.Translation]:
+        # The SDK's translate_batch is a loop of per-text translate calls, so
+        # each text is its own request anyway.  Calling translate directly
+        # lets every text run concurrently and be retried on its own, without
+        # re-translating (and re-billing) the texts that already succeeded.
+        c = self._client()
+        kwargs.update(_BATCH_TRANSLATE_OPTIONS)
+
+        def translate(text: str) -> _nativ_sdk.Translation:
+            if _shutting_down.is_set():
+                raise RuntimeError("Batch translation stopped: interpreter exiting")
+            return self._call_with_retry(c.translate, text, target_language, **kwargs)
+
+        workers = min(self._batch_max_concurrency, len(texts))
+        if workers <= 1:
+            return [translate(text) for text in texts]
+        # httpx.Client is thread-safe, so the requests share one pool.
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(translate, texts))
+
+    async def _atranslate_texts(
+        self, texts: List[str], target_language: str, **kwargs: Any
+    ) -> List[_nativ_sdk.Translation]:
+        c = self._aclient()
+        kwargs.update(_BATCH_TRANSLATE_OPTIONS)
+        sem = asyncio.Semaphore(self._batch_max_concurrency)
+
+        async def translate(text: str) -> _nativ_sdk.Translation:
+            async with sem:
+                return await self._acall_with_retry(
+                    c.translate, text, target_language, **kwargs
+                )
+
+        return list(await asyncio.gather(*(translate(text) for text in texts)))
 
     # ------------------------------------------------------------------
     # Tools
@@ -94,19 +648,20 @@ class NativToolSpec(BaseToolSpec):
             max_characters: Strict character limit for the output.
             backtranslate: If true, also return a back-translation to verify intent.
         """
-        with self._client() as c:
-            result = c.translate(
-                text,
-                target_language,
-                target_language_code=target_language_code,
-                source_language=source_language,
-                source_language_code=source_language_code,
-                context=context,
-                glossary=glossary,
-                formality=formality,
-                max_characters=max_characters,
-                backtranslate=backtranslate,
-            )
+        c = self._client()
+        result = self._call_with_retry(
+            c.translate,
+            text,
+            target_language,
+            target_language_code=target_language_code,
+            source_language=source_language,
+            source_language_code=source_language_code,
+            context=context,
+            glossary=glossary,
+            formality=formality,
+            max_characters=max_characters,
+            backtranslate=backtranslate,
+        )
         return _fmt_translation(result)
 
     def translate_batch(
@@ -130,26 +685,26 @@ class NativToolSpec(BaseToolSpec):
             context: Context hint for all translations.
             formality: Tone: very_informal | informal | neutral | formal | very_formal.
         """
-        with self._client() as c:
-            results = c.translate_batch(
-                texts,
-                target_language,
-                target_language_code=target_language_code,
-                source_language=source_language,
-                source_language_code=source_language_code,
-                context=context,
-                formality=formality,
-            )
-        return "\n".join(
-            f"{i + 1}. {r.translated_text}" for i, r in enumerate(results)
+        unique, inverse = _dedupe(texts)
+        results = self._translate_texts(
+            unique,
+            target_language,
+            target_language_code=target_language_code,
+            source_language=source_language,
+            source_language_code=source_language_code,
+            context=context,
+            formality=formality,
         )
+        if inverse is not None:
+            results = [results[i] for i in inverse]
+        return _fmt_batch(results)
 
     def search_translation_memory(
         self,
         query: str,
         source_language_code: str = "en",
         target_language_code: Optional[str] = None,
-        min_score: float = 0.0,
+        min_score: Optional[float] = None,
         limit: int = 10,
     ) -> str:
         """Fuzzy-search existing translations in the translation memory.
@@ -158,26 +713,18 @@ class NativToolSpec(BaseToolSpec):
             query: Text to search for.
             source_language_code: Source language code.
             target_language_code: Target language code to filter results.
-            min_score: Minimum fuzzy-match score (0-100).
+            min_score: Minimum fuzzy-match score (0-100). Defaults to a
+                length-adaptive threshold: 95 for very short queries,
+                relaxing to 50 for queries of 300+ characters.
             limit: Maximum number of results.
         """
-        with self._client() as c:
-            matches = c.search_tm(
-                query,
-                source_language_code=source_language_code,
-                target_language_code=target_language_code,
-                min_score=min_score,
-                limit=limit,
-            )
-        if not matches:
-            return "No matches found in translation memory."
-        lines = [f"Found {len(matches)} match(es):"]
-        for m in matches:
-            lines.append(
-                f'- [{m.score:.0f}% {m.match_type}] '
-                f'"{m.source_text}" -> "{m.target_text}"'
-            )
-        return "\n".join(lines)
+        answer, options, recent = self._search_prelude(
+            query, source_language_code, target_language_code, min_score, limit
+        )
+        if answer is not None:
+            return answer
+        matches = self._call_with_retry(self._client().search_tm, query, **options)
+        return self._search_result(query, options, recent, matches)
 
     def add_translation_memory_entry(
         self,
@@ -196,65 +743,247 @@ class NativToolSpec(BaseToolSpec):
             target_language_code: Target language code, e.g. 'fr'.
             name: Optional label for this entry, e.g. 'homepage hero copy'.
         """
-        with self._client() as c:
-            entry = c.add_tm_entry(
-                source_text,
-                target_text,
-                source_language_code,
-                target_language_code,
-                name=name,
-            )
-        return (
-            f"Added TM entry {entry.id}: "
-            f'"{entry.source_text}" ({entry.source_language_code}) -> '
-            f'"{entry.target_text}" ({entry.target_language_code})'
+        c = self._client()
+        entry = self._call_with_retry(
+            c.add_tm_entry,
+            source_text,
+            target_text,
+            source_language_code,
+            target_language_code,
+            name=name,
+            retry_on=_RETRYABLE_WRITE_ERRORS,
         )
+        # The new entry changes TM search results and stats.
+        self._cache.clear()
+        self._remember_tm_entry(entry)
+        return _fmt_tm_entry(entry)
 
     def get_languages(self) -> str:
         """List all target languages configured in the Nativ workspace."""
-        with self._client() as c:
-            langs = c.get_languages()
-        if not langs:
-            return "No languages configured."
-        lines = ["Configured languages:"]
-        for lang in langs:
-            entry = f"- {lang.language} ({lang.language_code})"
-            if lang.formality:
-                entry += f" -- formality: {lang.formality}"
-            lines.append(entry)
-        return "\n".join(lines)
+        return self._cached_read("get_languages", _fmt_languages)
 
     def get_style_guides(self) -> str:
         """Get all style guides configured in the workspace."""
-        with self._client() as c:
-            guides = c.get_style_guides()
-        if not guides:
-            return "No style guides configured."
-        lines = [f"Style guides ({len(guides)}):"]
-        for g in guides:
-            status = "enabled" if g.is_enabled else "disabled"
-            lines.append(f"\n## {g.title} [{status}]\n{g.content}")
-        return "\n".join(lines)
+        return self._cached_read("get_style_guides", _fmt_style_guides)
 
     def get_brand_voice(self) -> str:
         """Get the brand voice prompt that shapes all translations."""
-        with self._client() as c:
-            bv = c.get_brand_voice()
-        if not bv.exists or not bv.prompt:
-            return "No brand voice configured."
-        return f"Brand voice:\n{bv.prompt}"
+        return self._cached_read("get_brand_voice", _fmt_brand_voice)
 
     def get_translation_memory_stats(self) -> str:
         """Get TM stats: total entries, enabled/disabled, by source."""
-        with self._client() as c:
-            stats = c.get_tm_stats()
-        lines = [
-            f"Translation memory: {stats.total} total entries",
-            f"  Enabled: {stats.enabled}",
-            f"  Disabled: {stats.disabled}",
-        ]
-        if stats.by_source:
-            lines.append("  By source:")
-            for source, counts in stats.by_source.items():
-                lines.append(f"    {source}: {counts}")
-        return "\n".join(lines)
+        return self._cached_read("get_tm_stats", _fmt_tm_stats)
+
+    def prefetch_workspace_metadata(self) -> str:
+        """Get languages, style guides and brand voice in a single call.
+
+        Use this at the start of a task instead of calling get_languages,
+        get_style_guides and get_brand_voice one after another.
+        """
+        # The three lookups are independent, so they run on separate threads
+        # over the shared (thread-safe) connection pool.
+        getters = (self.get_languages, self.get_style_guides, self.get_brand_voice)
+        with ThreadPoolExecutor(max_workers=len(getters)) as pool:
+            futures = [pool.submit(getter) for getter in getters]
+            return "\n\n".join(f.result() for f in futures)
+
+    # ------------------------------------------------------------------
+    # Background batch jobs
+    # ------------------------------------------------------------------
+
+    def submit_translate_batch(
+        self,
+        texts: List[str],
+        target_language: str,
+        target_language_code: Optional[str] = None,
+        source_language: str = "English",
+        source_language_code: str = "en",
+        context: Optional[str] = None,
+        formality: Optional[str] = None,
+    ) -> str:
+        """Start translating a large list of texts in the background.
+
+        Returns a job ID immediately; use fetch_translate_batch_result to
+        collect the translations once the job is done. Prefer this over
+        translate_batch for hundreds of texts or more.
+
+        Args:
+            texts: List of texts to translate.
+            target_language: Full target language name, e.g. 'French'.
+            target_language_code: ISO language code.
+            source_language: Source language name.
+            source_language_code: Source language code.
+            context: Context hint for all translations.
+            formality: Tone: very_informal | informal | neutral | formal | very_formal.
+        """
+        pool = self._job_pool()
+        # Tools may be dispatched from parallel threads; _jobs_lock guards
+        # the job table (not _sync_lock, which _job_pool and the jobs use).
+        with self._jobs_lock:
+            job_id = f"batch_{next(self._job_ids)}"
+            self._prune_jobs()
+            self._jobs[job_id] = pool.submit(
+                self.translate_batch,
+                list(texts),
+                target_language,
+                target_language_code=target_language_code,
+                source_language=source_language,
+                source_language_code=source_language_code,
+                context=context,
+                formality=formality,
+            )
+        return (
+            f"Submitted batch job {job_id} ({len(texts)} texts). "
+            "Call fetch_translate_batch_result with this job ID to get the "
+            "translations."
+        )
+
+    def fetch_translate_batch_result(self, job_id: str) -> str:
+        """Get the result of a batch job started with submit_translate_batch.
+
+        Args:
+            job_id: The job ID returned by submit_translate_batch.
+        """
+        with self._jobs_lock:
+            future = self._jobs.get(job_id)
+            if future is None:
+                return f"Unknown batch job ID: {job_id}"
+            if not future.done():
+                return f"Batch job {job_id} is still running. Check again later."
+            del self._jobs[job_id]
+        if future.cancelled():
+            return f"Batch job {job_id} was cancelled before it started."
+        return future.result()
+
+    def _prune_jobs(self) -> None:
+        # Called with _jobs_lock held.
+        excess = len(self._jobs) - _MAX_JOBS + 1
+        if excess <= 0:
+            return
+        finished = [job_id for job_id, f in self._jobs.items() if f.done()]
+        for job_id in finished[:excess]:
+            del self._jobs[job_id]
+
+    # ------------------------------------------------------------------
+    # Async tools
+    # ------------------------------------------------------------------
+
+    async def atranslate(
+        self,
+        text: str,
+        target_language: str,
+        target_language_code: Optional[str] = None,
+        source_language: str = "English",
+        source_language_code: str = "en",
+        context: Optional[str] = None,
+        glossary: Optional[str] = None,
+        formality: Optional[str] = None,
+        max_characters: Optional[int] = None,
+        backtranslate: bool = False,
+    ) -> str:
+        """Async version of :meth:`translate`."""
+        c = self._aclient()
+        result = await self._acall_with_retry(
+            c.translate,
+            text,
+            target_language,
+            target_language_code=target_language_code,
+            source_language=source_language,
+            source_language_code=source_language_code,
+            context=context,
+            glossary=glossary,
+            formality=formality,
+            max_characters=max_characters,
+            backtranslate=backtranslate,
+        )
+        return _fmt_translation(result)
+
+    async def atranslate_batch(
+        self,
+        texts: List[str],
+        target_language: str,
+        target_language_code: Optional[str] = None,
+        source_language: str = "English",
+        source_language_code: str = "en",
+        context: Optional[str] = None,
+        formality: Optional[str] = None,
+    ) -> str:
+        """Async version of :meth:`translate_batch`."""
+        unique, inverse = _dedupe(texts)
+        results = await self._atranslate_texts(
+            unique,
+            target_language,
+            target_language_code=target_language_code,
+            source_language=source_language,
+            source_language_code=source_language_code,
+            context=context,
+            formality=formality,
+        )
+        if inverse is not None:
+            results = [results[i] for i in inverse]
+        return _fmt_batch(results)
+
+    async def asearch_translation_memory(
+        self,
+        query: str,
+        source_language_code: str = "en",
+        target_language_code: Optional[str] = None,
+        min_score: Optional[float] = None,
+        limit: int = 10,
+    ) -> str:
+        """Async version of :meth:`search_translation_memory`."""
+        answer, options, recent = self._search_prelude(
+            query, source_language_code, target_language_code, min_score, limit
+        )
+        if answer is not None:
+            return answer
+        matches = await self._acall_with_retry(
+            self._aclient().search_tm, query, **options
+        )
+        return self._search_result(query, options, recent, matches)
+
+    async def aadd_translation_memory_entry(
+        self,
+        source_text: str,
+        target_text: str,
+        source_language_code: str,
+        target_language_code: str,
+        name: Optional[str] = None,
+    ) -> str:
+        """Async version of :meth:`add_translation_memory_entry`."""
+        c = self._aclient()
+        entry = await self._acall_with_retry(
+            c.add_tm_entry,
+            source_text,
+            target_text,
+            source_language_code,
+            target_language_code,
+            name=name,
+            retry_on=_RETRYABLE_WRITE_ERRORS,
+        )
+        self._cache.clear()
+        self._remember_tm_entry(entry)
+        return _fmt_tm_entry(entry)
+
+    async def aget_languages(self) -> str:
+        """Async version of :meth:`get_languages`."""
+        return await self._acached_read("get_languages", _fmt_languages)
+
+    async def aget_style_guides(self) -> str:
+        """Async version of :meth:`get_style_guides`."""
+        return await self._acached_read("get_style_guides", _fmt_style_guides)
+
+    async def aget_brand_voice(self) -> str:
+        """Async version of :meth:`get_brand_voice`."""
+        return await self._acached_read("get_brand_voice", _fmt_brand_voice)
+
+    async def aget_translation_memory_stats(self) -> str:
+        """Async version of :meth:`get_translation_memory_stats`."""
+        return await self._acached_read("get_tm_stats", _fmt_tm_stats)
+
+    async def aprefetch_workspace_metadata(self) -> str:
+        """Async version of :meth:`prefetch_workspace_metadata`."""
+        sections = await asyncio.gather(
+            self.aget_languages(), self.aget_style_guides(), self.aget_brand_voice()
+        )
+        return "\n\n".join(sections)
@@ -6,7 +6,30 @@ access is needed.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import subprocess
+import sys
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from nativ import (
+    BrandVoice,
+    Language,
+    RateLimitError,
+    ServerError,
+    StyleGuide,
+    TMEntry,
+    TMMatch,
+    TMSearchMatch,
+    TMStats,
+    Translation,
+    TranslationMetadata,
+    ValidationError,
+)
 
 from llamaindex_nativ import NativToolSpec
 
@@ -19,8 +42,6 @@ FAKE_KEY = "nativ_test_00000000000000000000000000000000"
 
 
 def _translation(**overrides):
-    from nativ import Translation, TranslationMetadata
-
     defaults = dict(
         translated_text="Bonjour le monde",
         metadata=TranslationMetadata(word_count=2, cost=1),
@@ -33,8 +54,6 @@ def _translation(**overrides):
 
 
 def _tm_search_match(**overrides):
-    from nativ import TMSearchMatch
-
     defaults = dict(
         tm_id="tm_1",
         score=95.0,
@@ -48,8 +67,6 @@ def _tm_search_match(**overrides):
 
 
 def _tm_entry(**overrides):
-    from nativ import TMEntry
-
     defaults = dict(
         id="entry_1",
         source_language_code="en",
@@ -65,16 +82,12 @@ def _tm_entry(**overrides):
 
 
 def _language(**overrides):
-    from nativ import Language
-
     defaults = dict(id=1, language="French", language_code="fr", formality="formal")
     defaults.update(overrides)
     return Language(**defaults)
 
 
 def _style_guide(**overrides):
-    from nativ import StyleGuide
-
     defaults = dict(
         id="sg_1",
         title="Tone",
@@ -86,16 +99,12 @@ def _style_guide(**overrides):
 
 
 def _brand_voice(**overrides):
-    from nativ import BrandVoice
-
     defaults = dict(prompt="Be concise and friendly.", exists=True)
     defaults.update(overrides)
     return BrandVoice(**defaults)
 
 
 def _tm_stats(**overrides):
-    from nativ import TMStats
-
     defaults = dict(total=100, enabled=90, disabled=10, by_source={})
     defaults.update(overrides)
     return TMStats(**defaults)
@@ -107,10 +116,10 @@ def _tm_stats(**overrides):
 
 
 class TestNativToolSpec:
-    def test_to_tool_list_returns_eight(self):
+    def test_to_tool_list_returns_eleven(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
         tools = spec.to_tool_list()
-        assert len(tools) == 8
+        assert len(tools) == 11
 
     def test_tool_names(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
@@ -124,9 +133,254 @@ class TestNativToolSpec:
         assert "get_style_guides" in names
         assert "get_brand_voice" in names
         assert "get_translation_memory_stats" in names
+        assert "submit_translate_batch" in names
+        assert "fetch_translate_batch_result" in names
+        assert "prefetch_workspace_metadata" in names
 
     def test_spec_functions_count(self):
-        assert len(NativToolSpec.spec_functions) == 8
+        assert len(NativToolSpec.spec_functions) == 11
+
+    def test_to_tool_list_is_memoized(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        first = spec.to_tool_list()
+        second = spec.to_tool_list()
+        assert first == second
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_tool_metadata_independent_across_specs(self):
+        a = NativToolSpec(api_key=FAKE_KEY).to_tool_list()
+        b = NativToolSpec(api_key=FAKE_KEY).to_tool_list()
+        assert all(x.metadata is not y.metadata for x, y in zip(a, b))
+        assert all(x.metadata == y.metadata for x, y in zip(a, b))
+        assert all(
+            x.metadata.fn_schema is y.metadata.fn_schema for x, y in zip(a, b)
+        )
+        a[0].metadata.description = "Custom description"
+        assert b[0].metadata.description != "Custom description"
+        c = NativToolSpec(api_key=FAKE_KEY).to_tool_list()
+        assert c[0].metadata.description != "Custom description"
+
+    def test_tool_metadata_is_read_only(self):
+        metadata = NativToolSpec._tool_metadata()
+        description, _ = metadata["translate"]
+        assert "Args:" in description
+        with pytest.raises(TypeError):
+            metadata["translate"] = metadata["get_languages"]
+        with pytest.raises(TypeError):
+            metadata["translate"][0] = "Custom description"
+
+    def test_to_tool_list_with_custom_functions(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        tools = spec.to_tool_list(spec_functions=["get_languages"])
+        assert [t.metadata.name for t in tools] == ["get_languages"]
+
+    def test_tools_are_async_capable(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        tools = {t.metadata.name: t for t in spec.to_tool_list()}
+        assert tools["translate"].async_fn.__name__ == "atranslate"
+        assert "Args:" in tools["translate"].metadata.description
+
+
+# ---------------------------------------------------------------------------
+# SDK client lifecycle
+# ---------------------------------------------------------------------------
+
+
+class TestClientReuse:
+    def test_client_is_reused_across_calls(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        with patch("llamaindex_nativ.tools._nativ_sdk.Nativ") as mock_cls:
+            mock_cls.return_value.get_languages.return_value = []
+            mock_cls.return_value.get_brand_voice.return_value = _brand_voice()
+            spec.get_languages()
+            spec.get_brand_voice()
+
+        mock_cls.assert_called_once_with(api_key=FAKE_KEY, base_url=None)
+        mock_cls.return_value.close.assert_not_called()
+
+    def test_concurrent_first_calls_build_one_client(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        with patch("llamaindex_nativ.tools._nativ_sdk.Nativ") as mock_cls:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                clients = list(pool.map(lambda _: spec._client(), range(32)))
+
+        mock_cls.assert_called_once()
+        assert all(c is clients[0] for c in clients)
+
+    def test_close_releases_client(self):
+        spec = NativToolSpec(api_key=FAKE_KEY, cache_ttl=0)
+        with patch("llamaindex_nativ.tools._nativ_sdk.Nativ") as mock_cls:
+            mock_cls.return_value.get_languages.return_value = []
+            with spec:
+                spec.get_languages()
+            mock_cls.return_value.close.assert_called_once()
+
+            spec.get_languages()
+            assert mock_cls.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Retries
+# ---------------------------------------------------------------------------
+
+
+@patch("llamaindex_nativ.tools.time.sleep")
+class TestRetry:
+    def test_retries_transient_errors(self, sleep):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        mock_client = MagicMock()
+        mock_client.get_brand_voice.side_effect = [
+            RateLimitError("slow down", status_code=429),
+            ServerError("oops", status_code=503),
+            _brand_voice(),
+        ]
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            result = spec.get_brand_voice()
+
+        assert "concise and friendly" in result
+        assert mock_client.get_brand_voice.call_count == 3
+        assert sleep.call_count == 2
+
+    def test_gives_up_after_max_retries(self, sleep):
+        spec = NativToolSpec(api_key=FAKE_KEY, max_retries=2)
+        mock_client = MagicMock()
+        mock_client.get_tm_stats.side_effect = ServerError("down", status_code=502)
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            with pytest.raises(ServerError):
+                spec.get_translation_memory_stats()
+
+        assert mock_client.get_tm_stats.call_count == 3
+
+    def test_client_errors_are_not_retried(self, sleep):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        mock_client = MagicMock()
+        mock_client.translate.side_effect = ValidationError("bad", status_code=422)
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            with pytest.raises(ValidationError):
+                spec.translate("Hello", target_language="French")
+
+        mock_client.translate.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_add_entry_not_retried_on_server_error(self, sleep):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        mock_client = MagicMock()
+        mock_client.add_tm_entry.side_effect = ServerError("oops", status_code=500)
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            with pytest.raises(ServerError):
+                spec.add_translation_memory_entry("Hello", "Bonjour", "en", "fr")
+
+        mock_client.add_tm_entry.assert_called_once()
+
+    def test_async_retries(self, sleep):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        client = SimpleNamespace(
+            get_languages=AsyncMock(
+                side_effect=[RateLimitError("slow down"), [_language()]]
+            )
+        )
+
+        with patch.object(spec, "_aclient", return_value=client), patch(
+            "llamaindex_nativ.tools.asyncio.sleep", new=AsyncMock()
+        ) as async_sleep:
+            result = asyncio.run(spec.aget_languages())
+
+        assert "French (fr)" in result
+        async_sleep.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# Read-tool cache
+# ---------------------------------------------------------------------------
+
+
+class TestCache:
+    def test_read_tools_are_cached(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        mock_client = MagicMock()
+        mock_client.get_languages.return_value = [_language()]
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            first = spec.get_languages()
+            second = spec.get_languages()
+
+        assert first == second
+        mock_client.get_languages.assert_called_once()
+
+    def test_search_cache_keyed_by_arguments(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        mock_client = MagicMock()
+        mock_client.search_tm.return_value = [_tm_search_match()]
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            spec.search_translation_memory("Hello")
+            spec.search_translation_memory("Hello")
+            spec.search_translation_memory("Hello", target_language_code="fr")
+
+        assert mock_client.search_tm.call_count == 2
+
+    def test_cache_evicts_least_recently_used(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        mock_client = MagicMock()
+        mock_client.get_languages.return_value = [_language()]
+        mock_client.get_style_guides.return_value = [_style_guide()]
+        mock_client.get_brand_voice.return_value = _brand_voice()
+
+        with patch("llamaindex_nativ.tools._CACHE_MAXSIZE", 2), patch.object(
+            spec, "_client", return_value=mock_client
+        ):
+            spec.get_languages()
+            spec.get_style_guides()
+            spec.get_languages()
+            spec.get_brand_voice()
+            spec.get_languages()
+            spec.get_style_guides()
+
+        mock_client.get_languages.assert_called_once()
+        assert mock_client.get_style_guides.call_count == 2
+
+    def test_cache_expires(self):
+        spec = NativToolSpec(api_key=FAKE_KEY, cache_ttl=60)
+        mock_client = MagicMock()
+        mock_client.get_tm_stats.return_value = _tm_stats()
+
+        with patch.object(spec, "_client", return_value=mock_client), patch(
+            "llamaindex_nativ.tools.time.monotonic", side_effect=[0.0, 30.0, 61.0, 61.0]
+        ):
+            spec.get_translation_memory_stats()
+            spec.get_translation_memory_stats()
+            spec.get_translation_memory_stats()
+
+        assert mock_client.get_tm_stats.call_count == 2
+
+    def test_cache_disabled(self):
+        spec = NativToolSpec(api_key=FAKE_KEY, cache_ttl=0)
+        mock_client = MagicMock()
+        mock_client.get_brand_voice.return_value = _brand_voice()
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            spec.get_brand_voice()
+            spec.get_brand_voice()
+
+        assert mock_client.get_brand_voice.call_count == 2
+
+    def test_add_entry_invalidates_cache(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        mock_client = MagicMock()
+        mock_client.get_tm_stats.return_value = _tm_stats()
+        mock_client.add_tm_entry.return_value = _tm_entry()
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            spec.get_translation_memory_stats()
+            spec.add_translation_memory_entry("Hello", "Bonjour", "en", "fr")
+            spec.get_translation_memory_stats()
+
+        assert mock_client.get_tm_stats.call_count == 2
 
 
 # ---------------------------------------------------------------------------
@@ -139,8 +393,6 @@ class TestTranslate:
         spec = NativToolSpec(api_key=FAKE_KEY)
         mock_client = MagicMock()
         mock_client.translate.return_value = _translation()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
 
         with patch.object(spec, "_client", return_value=mock_client):
             result = spec.translate("Hello world", target_language="French")
@@ -151,20 +403,39 @@ class TestTranslate:
 
     def test_translate_with_backtranslation(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
-        mock_client = MagicMock()
-        mock_client.translate.return_value = _translation(
-            backtranslation="Hello world"
+        client = SimpleNamespace(
+            translate=lambda *a, **kw: _translation(
+                backtranslation="Hello world"
+            )
         )
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
 
-        with patch.object(spec, "_client", return_value=mock_client):
+        with patch.object(spec, "_client", return_value=client):
             result = spec.translate(
                 "Hello world", target_language="French", backtranslate=True
             )
 
         assert "Back-translation: Hello world" in result
 
+    def test_translate_with_tm_match(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        tm_match = TMMatch(
+            score=87.6,
+            match_type="fuzzy",
+            source_text="Hello world",
+            target_text="Bonjour le monde",
+            tm_source="manual",
+            tm_source_name=None,
+            tm_id="tm_1",
+        )
+        client = SimpleNamespace(
+            translate=lambda *a, **kw: _translation(rationale=None, tm_match=tm_match)
+        )
+
+        with patch.object(spec, "_client", return_value=client):
+            result = spec.translate("Hello world", target_language="French")
+
+        assert result == "Bonjour le monde\nTM match: 88% (fuzzy)"
+
 
 # ---------------------------------------------------------------------------
 # translate_batch
@@ -173,22 +444,250 @@ class TestTranslate:
 
 class TestTranslateBatch:
     def test_batch(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        translations = {"Hello": "Bonjour", "Goodbye": "Au revoir"}
+        client = SimpleNamespace(
+            translate=lambda text, *a, **kw: _translation(
+                translated_text=translations[text]
+            )
+        )
+
+        with patch.object(spec, "_client", return_value=client):
+            result = spec.translate_batch(
+                ["Hello", "Goodbye"], target_language="French"
+            )
+
+        assert "1. Bonjour" in result
+        assert "2. Au revoir" in result
+
+    def test_batch_uses_batch_translate_options(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
         mock_client = MagicMock()
-        mock_client.translate_batch.return_value = [
+        mock_client.translate.return_value = _translation()
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            spec.translate_batch(["Hello"], target_language="French", context="ui")
+
+        mock_client.translate.assert_called_once_with(
+            "Hello",
+            "French",
+            target_language_code=None,
+            source_language="English",
+            source_language_code="en",
+            context="ui",
+            formality=None,
+            include_tm_info=True,
+            backtranslate=False,
+            include_rationale=False,
+        )
+
+    def test_batch_deduplicates_repeated_texts(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        translations = {"Hello": "Bonjour", "Goodbye": "Au revoir"}
+        mock_client = MagicMock()
+        mock_client.translate.side_effect = lambda text, *a, **kw: _translation(
+            translated_text=translations[text]
+        )
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            result = spec.translate_batch(
+                ["Hello", "Goodbye", "Hello"], target_language="French"
+            )
+
+        sent = [call.args[0] for call in mock_client.translate.call_args_list]
+        assert sorted(sent) == ["Goodbye", "Hello"]
+        assert result == "1. Bonjour\n2. Au revoir\n3. Bonjour"
+
+    def test_batch_texts_run_concurrently_in_order(self):
+        spec = NativToolSpec(api_key=FAKE_KEY, batch_max_concurrency=4)
+        # Every text waits until four are in flight at once.
+        in_flight = threading.Barrier(4, timeout=5)
+
+        def translate(text, *a, **kw):
+            in_flight.wait()
+            return _translation(translated_text=text.upper())
+
+        client = SimpleNamespace(translate=translate)
+
+        with patch.object(spec, "_client", return_value=client):
+            result = spec.translate_batch(
+                ["a", "b", "c", "d", "e", "f", "g", "h"], target_language="French"
+            )
+
+        assert result == "1. A\n2. B\n3. C\n4. D\n5. E\n6. F\n7. G\n8. H"
+
+    @patch("llamaindex_nativ.tools.time.sleep")
+    def test_batch_retries_only_the_failed_text(self, sleep):
+        spec = NativToolSpec(api_key=FAKE_KEY, batch_max_concurrency=1)
+        mock_client = MagicMock()
+        mock_client.translate.side_effect = [
             _translation(translated_text="Bonjour"),
+            ServerError("oops", status_code=503),
             _translation(translated_text="Au revoir"),
         ]
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
 
         with patch.object(spec, "_client", return_value=mock_client):
             result = spec.translate_batch(
                 ["Hello", "Goodbye"], target_language="French"
             )
 
-        assert "1. Bonjour" in result
-        assert "2. Au revoir" in result
+        sent = [call.args[0] for call in mock_client.translate.call_args_list]
+        assert sent == ["Hello", "Goodbye", "Goodbye"]
+        assert result == "1. Bonjour\n2. Au revoir"
+        sleep.assert_called_once()
+
+    def test_async_batch_texts_run_concurrently_in_order(self):
+        spec = NativToolSpec(api_key=FAKE_KEY, batch_max_concurrency=2)
+        in_flight = []
+        peak = 0
+
+        async def translate(text, *args, **kwargs):
+            nonlocal peak
+            in_flight.append(text)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(text)
+            return _translation(translated_text=text.upper())
+
+        client = SimpleNamespace(translate=translate)
+
+        with patch.object(spec, "_aclient", return_value=client):
+            result = asyncio.run(
+                spec.atranslate_batch(["a", "b", "c"], target_language="French")
+            )
+
+        assert peak == 2
+        assert result == "1. A\n2. B\n3. C"
+
+
+# ---------------------------------------------------------------------------
+# Background batch jobs
+# ---------------------------------------------------------------------------
+
+
+class TestBatchJobs:
+    def test_submit_and_fetch(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        client = SimpleNamespace(
+            translate=lambda *a, **kw: _translation(translated_text="Bonjour")
+        )
+
+        with patch.object(spec, "_client", return_value=client):
+            submitted = spec.submit_translate_batch(["Hello"], "French")
+            assert "batch_1" in submitted
+            spec._jobs["batch_1"].result(timeout=5)
+            result = spec.fetch_translate_batch_result("batch_1")
+
+        assert result == "1. Bonjour"
+        assert "Unknown" in spec.fetch_translate_batch_result("batch_1")
+
+    def test_fetch_pending(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        release = threading.Event()
+        client = SimpleNamespace(
+            translate=lambda *a, **kw: (
+                release.wait(5) and _translation(translated_text="Bonjour")
+            )
+        )
+
+        with patch.object(spec, "_client", return_value=client):
+            spec.submit_translate_batch(["Hello"], "French")
+            assert "still running" in spec.fetch_translate_batch_result("batch_1")
+            release.set()
+            spec.close()
+
+        assert spec.fetch_translate_batch_result("batch_1") == "1. Bonjour"
+
+    def test_interpreter_exit_stops_running_job(self):
+        script = textwrap.dedent(
+            """
+            import sys, time
+            from types import SimpleNamespace
+            from llamaindex_nativ import NativToolSpec
+
+            def translate(*a, **kw):
+                time.sleep(0.05)
+                sys.stderr.write(".")
+                return SimpleNamespace(translated_text="x")
+
+            spec = NativToolSpec(api_key="k")
+            spec._client = lambda: SimpleNamespace(translate=translate)
+            spec.submit_translate_batch([str(i) for i in range(1000)], "French")
+            time.sleep(0.2)
+            """
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=30
+        )
+
+        assert proc.returncode == 0
+        assert proc.stderr.count(".") < 100
+
+    def test_fetch_unknown(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        assert "Unknown batch job ID" in spec.fetch_translate_batch_result("nope")
+
+    def test_fetch_after_close_cancelled_queued_job(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        started = threading.Event()
+        release = threading.Event()
+
+        def translate(*a, **kw):
+            started.set()
+            release.wait(5)
+            return _translation(translated_text="Bonjour")
+
+        client = SimpleNamespace(translate=translate)
+
+        with patch("llamaindex_nativ.tools._JOB_WORKERS", 1), patch.object(
+            spec, "_client", return_value=client
+        ):
+            spec.submit_translate_batch(["Hello"], "French")
+            spec.submit_translate_batch(["Hello"], "French")
+            started.wait(5)
+            cancelled = threading.Event()
+            spec._jobs["batch_2"].add_done_callback(lambda f: cancelled.set())
+            closer = threading.Thread(target=spec.close)
+            closer.start()
+            assert cancelled.wait(5)
+            release.set()
+            closer.join(5)
+
+        assert spec.fetch_translate_batch_result("batch_1") == "1. Bonjour"
+        assert "was cancelled" in spec.fetch_translate_batch_result("batch_2")
+        assert "Unknown" in spec.fetch_translate_batch_result("batch_2")
+
+    def test_concurrent_fetches_return_result_once(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        client = SimpleNamespace(
+            translate=lambda *a, **kw: _translation(translated_text="Bonjour")
+        )
+
+        with patch.object(spec, "_client", return_value=client):
+            spec.submit_translate_batch(["Hello"], "French")
+            spec._jobs["batch_1"].result(timeout=5)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(
+                    pool.map(spec.fetch_translate_batch_result, ["batch_1"] * 8)
+                )
+
+        assert results.count("1. Bonjour") == 1
+        assert sum("Unknown" in r for r in results) == 7
+
+    def test_unfetched_finished_jobs_are_bounded(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        client = SimpleNamespace(
+            translate=lambda *a, **kw: _translation(translated_text="Bonjour")
+        )
+
+        with patch("llamaindex_nativ.tools._MAX_JOBS", 2), patch.object(
+            spec, "_client", return_value=client
+        ):
+            for _ in range(4):
+                spec.submit_translate_batch(["Hello"], "French")
+                spec.close()
+
+        assert list(spec._jobs) == ["batch_3", "batch_4"]
 
 
 # ---------------------------------------------------------------------------
@@ -199,12 +698,9 @@ class TestTranslateBatch:
 class TestSearchTM:
     def test_with_matches(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
-        mock_client = MagicMock()
-        mock_client.search_tm.return_value = [_tm_search_match()]
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
+        client = SimpleNamespace(search_tm=lambda *a, **kw: [_tm_search_match()])
 
-        with patch.object(spec, "_client", return_value=mock_client):
+        with patch.object(spec, "_client", return_value=client):
             result = spec.search_translation_memory("Hello")
 
         assert "1 match" in result
@@ -213,15 +709,27 @@ class TestSearchTM:
 
     def test_no_matches(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
+        client = SimpleNamespace(search_tm=lambda *a, **kw: [])
+
+        with patch.object(spec, "_client", return_value=client):
+            result = spec.search_translation_memory("xyzzy")
+
+        assert "No matches found" in result
+
+    def test_default_min_score_adapts_to_query_length(self):
+        spec = NativToolSpec(api_key=FAKE_KEY, cache_ttl=0)
         mock_client = MagicMock()
         mock_client.search_tm.return_value = []
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
 
         with patch.object(spec, "_client", return_value=mock_client):
-            result = spec.search_translation_memory("xyzzy")
+            spec.search_translation_memory("Hi")
+            spec.search_translation_memory("x" * 600)
+            spec.search_translation_memory("Hi", min_score=0.0)
 
-        assert "No matches found" in result
+        scores = [c.kwargs["min_score"] for c in mock_client.search_tm.call_args_list]
+        assert scores[0] == 95.0 - 2 * 45.0 / 300
+        assert scores[1] == 50.0
+        assert scores[2] == 0.0
 
 
 # ---------------------------------------------------------------------------
@@ -232,12 +740,9 @@ class TestSearchTM:
 class TestAddTMEntry:
     def test_add_entry(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
-        mock_client = MagicMock()
-        mock_client.add_tm_entry.return_value = _tm_entry()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
+        client = SimpleNamespace(add_tm_entry=lambda *a, **kw: _tm_entry())
 
-        with patch.object(spec, "_client", return_value=mock_client):
+        with patch.object(spec, "_client", return_value=client):
             result = spec.add_translation_memory_entry(
                 "Hello", "Bonjour", "en", "fr"
             )
@@ -248,22 +753,164 @@ class TestAddTMEntry:
 
 
 # ---------------------------------------------------------------------------
-# get_languages
+# Recently added TM entries
 # ---------------------------------------------------------------------------
 
 
-class TestGetLanguages:
-    def test_with_languages(self):
+class TestRecentTMEntries:
+    def test_exact_search_served_from_recent_entries(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
         mock_client = MagicMock()
-        mock_client.get_languages.return_value = [
-            _language(),
-            _language(id=2, language="German", language_code="de", formality=None),
+        mock_client.add_tm_entry.side_effect = [
+            _tm_entry(),
+            _tm_entry(id="entry_2", source_text="Bye", target_text="Salut"),
         ]
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
 
         with patch.object(spec, "_client", return_value=mock_client):
+            spec.add_translation_memory_entry("Hello", "Bonjour", "en", "fr")
+            spec.add_translation_memory_entry("Bye", "Salut", "en", "fr")
+            hello = spec.search_translation_memory(
+                "Hello", target_language_code="fr", min_score=100, limit=1
+            )
+            bye = spec.search_translation_memory(
+                "Bye", target_language_code="fr", min_score=100, limit=1
+            )
+
+        mock_client.search_tm.assert_not_called()
+        assert hello == 'Found 1 match(es):\n- [100% exact] "Hello" -> "Bonjour"'
+        assert '"Bye" -> "Salut"' in bye
+
+    def test_fuzzy_search_still_hits_api(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        mock_client = MagicMock()
+        mock_client.add_tm_entry.return_value = _tm_entry()
+        mock_client.search_tm.return_value = []
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            spec.add_translation_memory_entry("Hello", "Bonjour", "en", "fr")
+            spec.search_translation_memory("Hello", target_language_code="fr")
+            spec.search_translation_memory("Hello", min_score=100)
+
+        assert mock_client.search_tm.call_count == 2
+
+    def test_multi_result_search_merges_recent_entry(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        mock_client = MagicMock()
+        mock_client.add_tm_entry.return_value = _tm_entry()
+        mock_client.search_tm.return_value = [
+            _tm_search_match(tm_id="tm_9", target_text="Salut"),
+            _tm_search_match(tm_id="entry_1", target_text="Bonjour"),
+        ]
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            spec.add_translation_memory_entry("Hello", "Bonjour", "en", "fr")
+            result = spec.search_translation_memory(
+                "Hello", target_language_code="fr", min_score=100, limit=2
+            )
+
+        mock_client.search_tm.assert_called_once()
+        assert result == (
+            "Found 2 match(es):\n"
+            '- [100% exact] "Hello" -> "Bonjour"\n'
+            '- [95% fuzzy] "Hello" -> "Salut"'
+        )
+
+    def test_disabled_when_cache_ttl_zero(self):
+        spec = NativToolSpec(api_key=FAKE_KEY, cache_ttl=0)
+        mock_client = MagicMock()
+        mock_client.add_tm_entry.return_value = _tm_entry()
+        mock_client.search_tm.return_value = []
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            spec.add_translation_memory_entry("Hello", "Bonjour", "en", "fr")
+            spec.search_translation_memory(
+                "Hello", target_language_code="fr", min_score=100, limit=1
+            )
+
+        mock_client.search_tm.assert_called_once()
+
+    def test_entries_expire_after_cache_ttl(self):
+        spec = NativToolSpec(api_key=FAKE_KEY, cache_ttl=60)
+        mock_client = MagicMock()
+        mock_client.add_tm_entry.return_value = _tm_entry()
+        mock_client.search_tm.return_value = []
+
+        with patch.object(spec, "_client", return_value=mock_client), patch(
+            "llamaindex_nativ.tools.time.monotonic", side_effect=[0.0, 61.0, 61.0]
+        ):
+            spec.add_translation_memory_entry("Hello", "Bonjour", "en", "fr")
+            result = spec.search_translation_memory(
+                "Hello", target_language_code="fr", min_score=100, limit=1
+            )
+
+        mock_client.search_tm.assert_called_once()
+        assert result == "No matches found in translation memory."
+        assert not spec._recent_tm_entries
+
+    def test_async_search_shares_recent_entry_logic(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        client = SimpleNamespace(
+            add_tm_entry=AsyncMock(return_value=_tm_entry()),
+            search_tm=AsyncMock(
+                return_value=[_tm_search_match(tm_id="tm_9", target_text="Salut")]
+            ),
+        )
+
+        async def run():
+            await spec.aadd_translation_memory_entry("Hello", "Bonjour", "en", "fr")
+            one = await spec.asearch_translation_memory(
+                "Hello", target_language_code="fr", min_score=100, limit=1
+            )
+            two = await spec.asearch_translation_memory(
+                "Hello", target_language_code="fr", min_score=100, limit=2
+            )
+            return one, two
+
+        with patch.object(spec, "_aclient", return_value=client):
+            one, two = asyncio.run(run())
+
+        client.search_tm.assert_awaited_once_with(
+            "Hello",
+            source_language_code="en",
+            target_language_code="fr",
+            min_score=100,
+            limit=2,
+        )
+        assert one == 'Found 1 match(es):\n- [100% exact] "Hello" -> "Bonjour"'
+        assert two.startswith('Found 2 match(es):\n- [100% exact] "Hello" -> "Bonjour"')
+
+    def test_invalidate_cache_forgets_entries(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        mock_client = MagicMock()
+        mock_client.add_tm_entry.return_value = _tm_entry()
+        mock_client.search_tm.return_value = []
+
+        with patch.object(spec, "_client", return_value=mock_client):
+            spec.add_translation_memory_entry("Hello", "Bonjour", "en", "fr")
+            spec.invalidate_cache()
+            spec.search_translation_memory(
+                "Hello", target_language_code="fr", min_score=100
+            )
+
+        mock_client.search_tm.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# get_languages
+# ---------------------------------------------------------------------------
+
+
+class TestGetLanguages:
+    def test_with_languages(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        client = SimpleNamespace(
+            get_languages=lambda *a, **kw: [
+                _language(),
+                _language(id=2, language="German", language_code="de", formality=None),
+            ]
+        )
+
+        with patch.object(spec, "_client", return_value=client):
             result = spec.get_languages()
 
         assert "French (fr)" in result
@@ -272,12 +919,9 @@ class TestGetLanguages:
 
     def test_empty(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
-        mock_client = MagicMock()
-        mock_client.get_languages.return_value = []
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
+        client = SimpleNamespace(get_languages=lambda *a, **kw: [])
 
-        with patch.object(spec, "_client", return_value=mock_client):
+        with patch.object(spec, "_client", return_value=client):
             result = spec.get_languages()
 
         assert "No languages configured" in result
@@ -291,12 +935,9 @@ class TestGetLanguages:
 class TestGetStyleGuides:
     def test_with_guides(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
-        mock_client = MagicMock()
-        mock_client.get_style_guides.return_value = [_style_guide()]
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
+        client = SimpleNamespace(get_style_guides=lambda *a, **kw: [_style_guide()])
 
-        with patch.object(spec, "_client", return_value=mock_client):
+        with patch.object(spec, "_client", return_value=client):
             result = spec.get_style_guides()
 
         assert "Tone" in result
@@ -304,12 +945,9 @@ class TestGetStyleGuides:
 
     def test_empty(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
-        mock_client = MagicMock()
-        mock_client.get_style_guides.return_value = []
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
+        client = SimpleNamespace(get_style_guides=lambda *a, **kw: [])
 
-        with patch.object(spec, "_client", return_value=mock_client):
+        with patch.object(spec, "_client", return_value=client):
             result = spec.get_style_guides()
 
         assert "No style guides configured" in result
@@ -323,26 +961,22 @@ class TestGetStyleGuides:
 class TestGetBrandVoice:
     def test_with_voice(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
-        mock_client = MagicMock()
-        mock_client.get_brand_voice.return_value = _brand_voice()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
+        client = SimpleNamespace(get_brand_voice=lambda *a, **kw: _brand_voice())
 
-        with patch.object(spec, "_client", return_value=mock_client):
+        with patch.object(spec, "_client", return_value=client):
             result = spec.get_brand_voice()
 
         assert "concise and friendly" in result
 
     def test_no_voice(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
-        mock_client = MagicMock()
-        mock_client.get_brand_voice.return_value = _brand_voice(
-            exists=False, prompt=None
+        client = SimpleNamespace(
+            get_brand_voice=lambda *a, **kw: _brand_voice(
+                exists=False, prompt=None
+            )
         )
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
 
-        with patch.object(spec, "_client", return_value=mock_client):
+        with patch.object(spec, "_client", return_value=client):
             result = spec.get_brand_voice()
 
         assert "No brand voice configured" in result
@@ -356,14 +990,133 @@ class TestGetBrandVoice:
 class TestGetTMStats:
     def test_stats(self):
         spec = NativToolSpec(api_key=FAKE_KEY)
-        mock_client = MagicMock()
-        mock_client.get_tm_stats.return_value = _tm_stats()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
+        client = SimpleNamespace(get_tm_stats=lambda *a, **kw: _tm_stats())
 
-        with patch.object(spec, "_client", return_value=mock_client):
+        with patch.object(spec, "_client", return_value=client):
             result = spec.get_translation_memory_stats()
 
         assert "100 total entries" in result
         assert "Enabled: 90" in result
         assert "Disabled: 10" in result
+
+
+# ---------------------------------------------------------------------------
+# prefetch_workspace_metadata
+# ---------------------------------------------------------------------------
+
+
+class TestPrefetchWorkspaceMetadata:
+    def test_combines_sections_in_order(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        client = SimpleNamespace(
+            get_languages=lambda: [_language()],
+            get_style_guides=lambda: [_style_guide()],
+            get_brand_voice=lambda: _brand_voice(),
+        )
+
+        with patch.object(spec, "_client", return_value=client):
+            result = spec.prefetch_workspace_metadata()
+
+        languages, guides, voice = result.split("\n\n", 2)
+        assert languages.startswith("Configured languages:")
+        assert guides.startswith("Style guides (1):")
+        assert "Brand voice:" in voice
+
+    def test_async(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        client = SimpleNamespace(
+            get_languages=AsyncMock(return_value=[]),
+            get_style_guides=AsyncMock(return_value=[]),
+            get_brand_voice=AsyncMock(return_value=_brand_voice(exists=False)),
+        )
+
+        with patch.object(spec, "_aclient", return_value=client):
+            result = asyncio.run(spec.aprefetch_workspace_metadata())
+
+        assert result == (
+            "No languages configured.\n\n"
+            "No style guides configured.\n\n"
+            "No brand voice configured."
+        )
+
+
+# ---------------------------------------------------------------------------
+# Async tools
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncTools:
+    def test_atranslate(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        mock_client = MagicMock()
+        mock_client.translate = AsyncMock(return_value=_translation())
+
+        with patch.object(spec, "_aclient", return_value=mock_client):
+            result = asyncio.run(
+                spec.atranslate("Hello world", target_language="French")
+            )
+
+        assert "Bonjour le monde" in result
+        mock_client.translate.assert_awaited_once()
+
+    def test_aget_languages(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        client = SimpleNamespace(get_languages=AsyncMock(return_value=[_language()]))
+
+        with patch.object(spec, "_aclient", return_value=client):
+            result = asyncio.run(spec.aget_languages())
+
+        assert "French (fr)" in result
+
+    def test_async_client_is_reused_and_closed(self):
+        spec = NativToolSpec(api_key=FAKE_KEY, cache_ttl=0)
+
+        async def run():
+            async with spec:
+                await spec.aget_brand_voice()
+                await spec.aget_brand_voice()
+
+        with patch("llamaindex_nativ.tools._nativ_sdk.AsyncNativ") as mock_cls:
+            mock_cls.return_value.get_brand_voice = AsyncMock(
+                return_value=_brand_voice()
+            )
+            mock_cls.return_value.close = AsyncMock()
+            asyncio.run(run())
+
+        mock_cls.assert_called_once_with(api_key=FAKE_KEY, base_url=None)
+        mock_cls.return_value.close.assert_awaited_once()
+
+    def test_aclose_does_not_block_event_loop(self):
+        spec = NativToolSpec(api_key=FAKE_KEY)
+        release = threading.Event()
+        client = SimpleNamespace(
+            translate=lambda *a, **kw: (
+                release.wait(5) and _translation(translated_text="Bonjour")
+            )
+        )
+
+        async def run():
+            closing = asyncio.create_task(spec.aclose())
+            await asyncio.sleep(0.05)
+            assert not closing.done()
+            release.set()
+            await closing
+
+        with patch.object(spec, "_client", return_value=client):
+            spec.submit_translate_batch(["Hello"], "French")
+            asyncio.run(run())
+
+        assert spec.fetch_translate_batch_result("batch_1") == "1. Bonjour"
+
+    def test_async_client_rebuilt_for_new_event_loop(self):
+        spec = NativToolSpec(api_key=FAKE_KEY, cache_ttl=0)
+
+        with patch("llamaindex_nativ.tools._nativ_sdk.AsyncNativ") as mock_cls:
+            mock_cls.side_effect = lambda **kw: SimpleNamespace(
+                get_brand_voice=AsyncMock(return_value=_brand_voice())
+            )
+            first = asyncio.run(spec.aget_brand_voice())
+            second = asyncio.run(spec.aget_brand_voice())
+
+        assert first == second
+        assert mock_cls.call_count == 2